@@ -30,6 +30,7 @@ from pants.jvm.target_types import (
     JvmProvidesTypesField,
     JvmResolveField,
 )
+from pants.util.memo import memoized
 from pants.util.strutil import softwrap
 
 
@@ -37,31 +38,38 @@ class ScalaSettingsRequest(TargetFilesGeneratorSettingsRequest):
     pass
 
 
+@memoized
+def _warn_force_add_siblings_default() -> None:
+    """Emit the deprecation at most once per process: the settings rule may re-run after pantsd
+    invalidations, and the warning depends only on the option being left at its default."""
+    warn_or_error(
+        removal_version="2.14.0.dev0",
+        entity="`force_add_siblings_as_dependencies` defaulting to True",
+        hint=softwrap(
+            """
+            Setting this option to true reduces the precision of dependency information.
+            That means that you may end up compiling more than is necessary for a particular task,
+            and that compilation will be invalidated more frequently than actually necessary.
+            However, setting to true may be helpful if compilation fails due to missing dependencies.
+
+            We have made several improvements to Pants's Scala dependency inference,
+            where we no longer think it's necessary to adding dependencies on sibling targets.
+            If you have compilation failures after disabling this option, please consider opening an issue at
+            https://github.com/pantsbuild/pants/issues/new so that we can continue to improve Pants's dependency inference.
+
+            To opt into the new default early, set `force_add_siblings_as_dependencies = false` in the `[scala_infer]`
+            section in `pants.toml`. Otherwise, set to `true` to silence this warning.
+            """
+        ),
+    )
+
+
 @rule
 def scala_settings_request(
     scala_infer_subsystem: ScalaInferSubsystem, _: ScalaSettingsRequest
 ) -> TargetFilesGeneratorSettings:
     if scala_infer_subsystem.options.is_default("force_add_siblings_as_dependencies"):
-        warn_or_error(
-            removal_version="2.14.0.dev0",
-            entity="`force_add_siblings_as_dependencies` defaulting to True",
-            hint=softwrap(
-                """
-                Setting this option to true reduces the precision of dependency information.
-                That means that you may end up compiling more than is necessary for a particular task,
-                and that compilation will be invalidated more frequently than actually necessary.
-                However, setting to true may be helpful if compilation fails due to missing dependencies.
-
-                We have made several improvements to Pants's Scala dependency inference,
-                where we no longer think it's necessary to adding dependencies on sibling targets.
-                If you have compilation failures after disabling this option, please consider opening an issue at
-                https://github.com/pantsbuild/pants/issues/new so that we can continue to improve Pants's dependency inference.
-
-                To opt into the new default early, set `force_add_siblings_as_dependencies = false` in the `[scala_infer]`
-                section in `pants.toml`. Otherwise, set to `true` to silence this warning.
-                """
-            ),
-        )
+        _warn_force_add_siblings_default()
 
     return TargetFilesGeneratorSettings(
         add_dependencies_on_all_siblings=scala_infer_subsystem.force_add_siblings_as_dependencies
@@ -240,10 +248,10 @@ class ScalaSourceTarget(Target):
 
 
 class ScalaSourcesGeneratorSourcesField(ScalaGeneratorSourcesField):
-    default = (
-        "*.scala",
-        *(f"!{pat}" for pat in (ScalaJunitTestsGeneratorSourcesField.default)),
-        *(f"!{pat}" for pat in (ScalatestTestsGeneratorSourcesField.default)),
+    default = ("*.scala",) + tuple(
+        f"!{pat}"
+        for pat in ScalaJunitTestsGeneratorSourcesField.default
+        + ScalatestTestsGeneratorSourcesField.default
     )
     help = generate_multiple_sources_field_help_message(
         "Example: `sources=['Example.scala', 'New*.scala', '!OldIgnore.scala']`"
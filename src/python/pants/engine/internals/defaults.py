@@ -12,13 +12,21 @@ parser.
 """
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from typing import Any, Iterable, Mapping, Tuple, Union
 
 from pants.engine.addresses import Address
-from pants.engine.target import ImmutableValue, InvalidFieldException, RegisteredTargetTypes
+from pants.engine.target import (
+    Field,
+    ImmutableValue,
+    InvalidFieldException,
+    RegisteredTargetTypes,
+    Target,
+)
 from pants.engine.unions import UnionMembership
 from pants.util.frozendict import FrozenDict
+from pants.util.memo import memoized
 
 SetDefaultsValueT = Mapping[str, Any]
 SetDefaultsKeyT = Union[str, Tuple[str, ...]]
@@ -29,6 +37,27 @@ class BuildFileDefaults(FrozenDict[str, FrozenDict[str, ImmutableValue]]):
     """Map target types to default field values."""
 
 
+# Most BUILD files never call `__defaults__`, so share a single empty instance rather than
+# allocating a fresh one per parsed BUILD file.
+_EMPTY_DEFAULTS = BuildFileDefaults({})
+
+
+@memoized
+def _field_types_by_alias(
+    target_type: type[Target], union_membership: UnionMembership
+) -> dict[str, type[Field]]:
+    """Map the aliases (and deprecated aliases) of a target type's fields to the field types.
+
+    Memoized process-wide: a parser state is created per BUILD file directory, so caching this on
+    the state would redo the same work for every directory, while the result depends only on the
+    target type and the union membership. Keying on the target type also means a deprecated target
+    alias shares the entry of its canonical alias.
+    """
+    return target_type._get_field_aliases_to_field_types(
+        target_type.class_field_types(union_membership)
+    )
+
+
 @dataclass
 class BuildFileDefaultsParserState:
     address: Address
@@ -36,6 +65,11 @@ class BuildFileDefaultsParserState:
     registered_target_types: RegisteredTargetTypes
     union_membership: UnionMembership
 
+    def __post_init__(self) -> None:
+        # The alias -> target type mapping is immutable for the lifetime of this state, so fetch
+        # it once rather than on every `__defaults__` call.
+        self._types = self.registered_target_types.aliases_to_types
+
     @classmethod
     def create(
         cls,
@@ -52,24 +86,26 @@ class BuildFileDefaultsParserState:
         )
 
     def get_frozen_defaults(self) -> BuildFileDefaults:
-        types = self.registered_target_types.aliases_to_types
-        return BuildFileDefaults(
-            {
-                target_alias: FrozenDict(
-                    {
-                        field_type.alias: field_type.compute_value(
-                            raw_value=default, address=self.address
-                        )
-                        for field_alias, default in fields.items()
-                        for field_type in types[target_alias].class_field_types(
-                            self.union_membership
-                        )
-                        if field_alias in (field_type.alias, field_type.deprecated_alias)
-                    }
-                )
-                for target_alias, fields in self.defaults.items()
-            }
-        )
+        if not self.defaults:
+            return _EMPTY_DEFAULTS
+        # Hoist attribute lookups out of the loops; this runs for every target alias x field of
+        # every `__defaults__` in the repo.
+        address = self.address
+        union_membership = self.union_membership
+        frozen_defaults: dict[str, FrozenDict[str, ImmutableValue]] = {}
+        for target_alias, fields in self.defaults.items():
+            get_field_type = _field_types_by_alias(self._types[target_alias], union_membership).get
+            field_values: dict[str, ImmutableValue] = {}
+            for field_alias, default in fields.items():
+                field_type = get_field_type(field_alias)
+                if field_type is not None:
+                    # Intern the alias keys: they repeat across the `BuildFileDefaults` of every
+                    # BUILD file, and the frozen defaults stay resident in pantsd.
+                    field_values[sys.intern(field_type.alias)] = field_type.compute_value(
+                        raw_value=default, address=address
+                    )
+            frozen_defaults[sys.intern(target_alias)] = FrozenDict.frozen(field_values)
+        return BuildFileDefaults.frozen(frozen_defaults)
 
     def get(self, target_alias: str) -> Mapping[str, Any]:
         # Used by `pants.engine.internals.parser.Parser._generate_symbols.Registrar.__call__`
@@ -82,19 +118,16 @@ class BuildFileDefaultsParserState:
         extend: bool = False,
         **kwargs,
     ) -> None:
-        defaults: dict[str, dict[str, Any]] = (
-            {} if not extend else {k: dict(v) for k, v in self.defaults.items()}
-        )
+        # Only the target aliases touched by this call end up in `defaults`. With `extend=True`
+        # the bucket for an alias is seeded from the current defaults the first time it is
+        # touched, rather than eagerly copying every inherited entry up front.
+        defaults: dict[str, dict[str, Any]] = {}
 
         if all is not None:
-            self._process_defaults(
-                defaults,
-                {tuple(self.registered_target_types.aliases): all},
-                ignore_unknown_fields=True,
-            )
+            self._process_all_defaults(defaults, all, extend=extend)
 
         for arg in args:
-            self._process_defaults(defaults, arg)
+            self._process_defaults(defaults, arg, extend=extend)
 
         # Update with new defaults, dropping targets without any default values.
         for tgt, default in defaults.items():
@@ -103,11 +136,67 @@ class BuildFileDefaultsParserState:
             else:
                 self.defaults[tgt] = default
 
+    def _update_defaults(
+        self,
+        defaults: dict[str, dict[str, Any]],
+        target_alias: str,
+        values: Mapping[str, Any] | Iterable[tuple[str, Any]],
+        extend: bool,
+    ) -> None:
+        bucket = defaults.get(target_alias)
+        if bucket is not None:
+            bucket.update(values)
+        elif extend:
+            bucket = dict(self.defaults.get(target_alias, ()))
+            bucket.update(values)
+            defaults[sys.intern(target_alias)] = bucket
+        else:
+            # First write for this alias: materialize the values as the bucket directly rather
+            # than creating an empty dict only to merge into it.
+            defaults[sys.intern(target_alias)] = dict(values)
+
+    def _process_all_defaults(
+        self, defaults: dict[str, dict[str, Any]], all_defaults: SetDefaultsValueT, extend: bool
+    ) -> None:
+        """Apply default field values to every registered target type, skipping unknown fields.
+
+        This is the `__defaults__(all=...)` path. Rather than validating `all_defaults` against each
+        target type in turn, filter it down to the fields valid for that type.
+        """
+        if not isinstance(all_defaults, dict):
+            raise ValueError(
+                f"Invalid default field values in {self.address} for all targets, "
+                f"must be an `dict` but was {all_defaults!r} with type "
+                f"`{type(all_defaults).__name__}`."
+            )
+
+        union_membership = self.union_membership
+        for target_alias, target_type in self._types.items():
+            if target_alias != target_type.alias:
+                # A deprecated target alias shares its defaults with the canonical alias.
+                continue
+            valid_field_aliases = _field_types_by_alias(target_type, union_membership).keys()
+            if all_defaults.keys() <= valid_field_aliases:
+                # The common case: every provided field is valid for this target type, so there
+                # is nothing to filter out.
+                self._update_defaults(defaults, target_alias, all_defaults, extend)
+            else:
+                self._update_defaults(
+                    defaults,
+                    target_alias,
+                    (
+                        (field_alias, default)
+                        for field_alias, default in all_defaults.items()
+                        if field_alias in valid_field_aliases
+                    ),
+                    extend,
+                )
+
     def _process_defaults(
         self,
         defaults: dict[str, dict[str, Any]],
         targets_defaults: SetDefaultsT,
-        ignore_unknown_fields: bool = False,
+        extend: bool = False,
     ):
         if not isinstance(targets_defaults, dict):
             raise ValueError(
@@ -115,7 +204,12 @@ class BuildFileDefaultsParserState:
                 f"but got: {type(targets_defaults).__name__}."
             )
 
-        types = self.registered_target_types.aliases_to_types
+        types = self._types
+        union_membership = self.union_membership
+        # Expand tuple keys up front — validating each entry in input order, and resolving
+        # deprecated target aliases to their canonical alias — so that the merge loop below is a
+        # flat iteration without per-entry isinstance checks.
+        normalized: dict[str, SetDefaultsValueT] = {}
         for target, default in targets_defaults.items():
             if not isinstance(default, dict):
                 raise ValueError(
@@ -125,36 +219,36 @@ class BuildFileDefaultsParserState:
 
             targets: Iterable[str]
             targets = target if isinstance(target, tuple) else (target,)
-            for target_alias in map(str, targets):
-                if target_alias in types:
-                    target_type = types[target_alias]
-                else:
+            for target_alias in targets:
+                target_type = types.get(target_alias)
+                if target_type is None:
                     raise ValueError(f"Unrecognized target type {target_alias} in {self.address}.")
 
-                # Copy default dict if we may mutate it.
-                raw_values = dict(default) if ignore_unknown_fields else default
-
-                # Validate that field exists on target
-                valid_field_aliases = set(
-                    target_type._get_field_aliases_to_field_types(
-                        target_type.class_field_types(self.union_membership)
-                    ).keys()
-                )
-
-                for field_alias in default.keys():
-                    if field_alias not in valid_field_aliases:
-                        if ignore_unknown_fields:
-                            del raw_values[field_alias]
-                        else:
-                            raise InvalidFieldException(
-                                f"Unrecognized field `{field_alias}` for target {target_type.alias}. "
-                                f"Valid fields are: {', '.join(sorted(valid_field_aliases))}.",
-                            )
+                # Validate that all fields exist on the target: a single set difference rather
+                # than a membership test per provided field.
+                valid_field_aliases = _field_types_by_alias(target_type, union_membership).keys()
+                unknown_fields = default.keys() - valid_field_aliases
+                if unknown_fields:
+                    # Report the first unknown field in the order it was provided.
+                    field_alias = next(k for k in default if k in unknown_fields)
+                    raise InvalidFieldException(
+                        f"Unrecognized field `{field_alias}` for target {target_type.alias}. "
+                        f"Valid fields are: {', '.join(sorted(valid_field_aliases))}.",
+                    )
+
+                existing = normalized.get(target_type.alias)
+                if existing is None:
+                    normalized[target_type.alias] = default
+                else:
+                    # The same target type was given under more than one key in this call; later
+                    # entries win per field, matching the merge order of the buckets below.
+                    normalized[target_type.alias] = {**existing, **default}
 
-                # TODO: moved fields for TargetGenerators ?  See: `Target._calculate_field_values()`.
+        # TODO: moved fields for TargetGenerators ?  See: `Target._calculate_field_values()`.
 
-                # TODO: support parametrization ? --needs special care due to Parametrize object not
-                # being hashable, and thus not acceptable in a FrozenDict instance.
+        # TODO: support parametrization ? --needs special care due to Parametrize object not
+        # being hashable, and thus not acceptable in a FrozenDict instance.
 
-                # Merge all provided defaults for this call.
-                defaults.setdefault(target_type.alias, {}).update(raw_values)
+        # Merge all provided defaults for this call.
+        for target_alias, default in normalized.items():
+            self._update_defaults(defaults, target_alias, default, extend)
@@ -3,7 +3,8 @@
 
 from __future__ import annotations
 
-from collections import namedtuple
+from dataclasses import dataclass, field
+from typing import Any
 
 import pytest
 
@@ -51,11 +52,14 @@ def test_assumptions(
     )
 
 
-Scenario = namedtuple(
-    "Scenario",
-    "path, args, kwargs, expected_defaults, expected_error, parent_defaults",
-    defaults=("", (), {}, {}, None, {}),
-)
+@dataclass(frozen=True)
+class Scenario:
+    path: str = ""
+    args: tuple[Any, ...] = ()
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    expected_defaults: dict[str, dict[str, Any]] = field(default_factory=dict)
+    expected_error: Any = None
+    parent_defaults: dict[str, dict[str, Any]] = field(default_factory=dict)
 
 
 @pytest.mark.parametrize(
@@ -105,6 +109,47 @@ Scenario = namedtuple(
             ),
             id="extend test",
         ),
+        pytest.param(
+            Scenario(
+                path="src/proj/a",
+                args=(
+                    {
+                        Test1Target.alias: dict(tags=["first"]),
+                        (Test1Target.alias, Test2Target.alias): dict(description="shared desc"),
+                    },
+                ),
+                expected_defaults={
+                    "test_type_1": {
+                        "tags": ("first",),
+                        "description": "shared desc",
+                    },
+                    "test_type_2": {"description": "shared desc"},
+                },
+            ),
+            id="merge defaults for target type in multiple keys",
+        ),
+        pytest.param(
+            Scenario(
+                path="src/proj/a",
+                args=({Test2Target.alias: dict(description="only desc")},),
+                kwargs=dict(all=dict(tags=["tagged"]), extend=True),
+                parent_defaults={
+                    "target": {"description": "parent desc"},
+                },
+                expected_defaults={
+                    "target": {
+                        "description": "parent desc",
+                        "tags": ("tagged",),
+                    },
+                    "test_type_1": {"tags": ("tagged",)},
+                    "test_type_2": {
+                        "tags": ("tagged",),
+                        "description": "only desc",
+                    },
+                },
+            ),
+            id="extend all",
+        ),
         pytest.param(
             Scenario(
                 args=(["bad type"],),
@@ -205,18 +205,21 @@ async def resolve_target_parametrizations(
         generator_fields = dict(target_adaptor.kwargs)
         template_fields = {}
         if issubclass(target_type, TargetGenerator):
-            copied_fields = (
-                *target_type.copied_fields,
-                *target_type._find_plugin_fields(union_membership),
+            copied_field_aliases = (
+                *target_type.copied_field_aliases,
+                *(
+                    field_type.alias
+                    for field_type in target_type._find_plugin_fields(union_membership)
+                ),
             )
-            for field_type in copied_fields:
-                field_value = generator_fields.get(field_type.alias, None)
+            for field_alias in copied_field_aliases:
+                field_value = generator_fields.get(field_alias, None)
                 if field_value is not None:
-                    template_fields[field_type.alias] = field_value
-            for field_type in target_type.moved_fields:
-                field_value = generator_fields.pop(field_type.alias, None)
+                    template_fields[field_alias] = field_value
+            for field_alias in target_type.moved_field_aliases:
+                field_value = generator_fields.pop(field_alias, None)
                 if field_value is not None:
-                    template_fields[field_type.alias] = field_value
+                    template_fields[field_alias] = field_value
 
         generator_fields_parametrized = {
             name for name, field in generator_fields.items() if isinstance(field, Parametrize)
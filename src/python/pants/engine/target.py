@@ -962,6 +962,22 @@ class TargetGenerator(Target):
     # acting as a convenient place for them to be specified.
     moved_fields: ClassVar[Tuple[Type[Field], ...]]
 
+    @final
+    @memoized_classproperty
+    def copied_field_aliases(cls) -> tuple[str, ...]:
+        """The aliases of `copied_fields`, resolved once per target generator type.
+
+        NB: This is a tuple rather than a set to keep a deterministic iteration order, as the
+        order in which template fields are collected is observable in the generated targets.
+        """
+        return tuple(field_type.alias for field_type in cls.copied_fields)
+
+    @final
+    @memoized_classproperty
+    def moved_field_aliases(cls) -> tuple[str, ...]:
+        """The aliases of `moved_fields`, resolved once per target generator type."""
+        return tuple(field_type.alias for field_type in cls.moved_fields)
+
     def validate(self) -> None:
         super().validate()
 
@@ -1002,10 +1018,16 @@ class TargetFilesGenerator(TargetGenerator):
 
 
 @union
+@dataclass(frozen=True)
 class TargetFilesGeneratorSettingsRequest:
     """An optional union to provide dynamic settings for a `TargetFilesGenerator`.
 
     See `TargetFilesGenerator`.
+
+    NB: This is a `dataclass` so that request instances compare equal by value: the engine keys
+    its rule memoization on the request, and `generate_file_targets` constructs a fresh instance
+    per target generator. With identity-based equality the settings rule would re-run (and its
+    subsystem lookups would be repeated) for every generator in the repo.
     """
 
 
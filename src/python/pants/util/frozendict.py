@@ -9,6 +9,7 @@ from pants.util.memo import memoized_method
 
 K = TypeVar("K")
 V = TypeVar("V")
+_FD = TypeVar("_FD", bound="FrozenDict")
 
 
 class FrozenDict(Mapping[K, V]):
@@ -47,6 +48,18 @@ class FrozenDict(Mapping[K, V]):
         # performance bottleneck.
         self._hash = self._calculate_hash()
 
+    @classmethod
+    def frozen(cls: type[_FD], to_freeze: dict) -> _FD:
+        """Create a `FrozenDict` that wraps `to_freeze` without copying it.
+
+        The caller must not mutate `to_freeze` after this call. This is useful on hot code paths
+        where the dict was just built and would otherwise be copied only to be thrown away.
+        """
+        result = cls.__new__(cls)
+        result._data = to_freeze
+        result._hash = result._calculate_hash()
+        return result
+
     def __getitem__(self, k: K) -> V:
         return self._data[k]
 
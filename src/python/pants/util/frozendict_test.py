@@ -43,6 +43,16 @@ def test_original_data_gets_copied() -> None:
     assert fd1 == FrozenDict({"a": 0, "b": 1})
 
 
+def test_frozen() -> None:
+    d1 = {"a": 0, "b": 1}
+    fd1 = FrozenDict.frozen(d1)
+    assert fd1 == FrozenDict(d1)
+    assert hash(fd1) == hash(FrozenDict(d1))
+
+    with pytest.raises(TypeError):
+        FrozenDict.frozen({0: []})
+
+
 def test_len() -> None:
     assert len(FrozenDict()) == 0
     assert len(FrozenDict({"a": 0, "b": 1})) == 2